@@ -337,26 +337,20 @@ class IndentationFitter(object):
         ivals, istep = np.linspace(smooth_e.min(), smooth_e.max(), ni,
                                    endpoint=False, retstep=True)
         ivals += istep/2
-        labelarray = np.zeros_like(smooth_e, dtype=int)
-        valarray = np.zeros_like(smooth_e, dtype=int)
+        # bin index of each value
+        valarray = np.argmin(np.abs(ivals[np.newaxis, :]
+                                    - smooth_e[:, np.newaxis]), axis=1)
         # label each sequence with an individual `idx`
-        for ii in range(smooth_e.shape[0]):
-            valid = np.argmin(np.abs(ivals - smooth_e[ii]))
-            if ii == 0:
-                idx = 0
-            elif valid == valarray[ii-1]:
-                pass
-            else:
-                idx += 1
-            labelarray[ii] = idx
-            valarray[ii] = valid
+        labelarray = np.zeros_like(smooth_e, dtype=int)
+        np.cumsum(valarray[1:] != valarray[:-1], out=labelarray[1:])
         # Determine the longest sequence
         counts = list(np.bincount(labelarray))
         # Ignore values that are below cutoff
 
         for ii in range(len(counts)):
             labmax = np.argmax(counts)
-            labid = np.where(labelarray == labmax)[0][0]
+            # first index of the label (`labelarray` is sorted)
+            labid = np.searchsorted(labelarray, labmax)
             valmax = ivals[valarray[labid]]
             if valmax > istep:
                 break
@@ -366,12 +360,12 @@ class IndentationFitter(object):
             warnings.warn("Could not find correct plateau.", FitWarning)
             labmax = 5
         # Determine the interval in the original array
-        indices = np.where(labelarray == labmax)[0]
-        if len(indices) == 1:
-            dopt = indentations[indices[0]]
+        start, stop = np.searchsorted(labelarray, [labmax, labmax + 1])
+        if stop - start == 1:
+            dopt = indentations[start]
         else:
             # compute optimal indentation as center
-            dopt = np.average(indentations[indices[0]:indices[-1]])
+            dopt = np.average(indentations[start:stop-1])
         return dopt
 
     def _fit(self):
@@ -399,6 +393,14 @@ class IndentationFitter(object):
         x = self.x_axis[self.fit_range] * self.fp["gcf_k"]
         # y: the values being fitted
         y = self.y_axis[self.fit_range]
+        # The model functions work with data that start at the baseline
+        # (see `model.residuals.model_direction_agnostic`), e.g. the
+        # retract curve is reversed in every model evaluation. Since the
+        # order of the residuals does not matter, reverse the data only
+        # once here.
+        if x.size and x[0] < x[-1]:
+            x = x[::-1].copy()
+            y = y[::-1].copy()
 
         md = model.models_available[model_key]
 
@@ -467,7 +469,8 @@ class IndentationFitter(object):
             # This is easy. Simply set the boolean array of fitting values
             # Exclude data points from other segment
             if range_x[0] != range_x[1]:
-                x_data = self.x_axis.copy()
+                # `self.x_axis` is read-only, no need to copy it
+                x_data = self.x_axis
                 range_bool = self.segment.copy()
                 rmin, rmax = np.min(range_x), np.max(range_x)
                 range_bool[x_data < rmin] = False
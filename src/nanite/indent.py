@@ -1,5 +1,4 @@
 from collections import OrderedDict
-import copy
 import warnings
 
 import afmformats
@@ -32,6 +31,13 @@ class Indentation(afmformats.AFMForceDistance):
         # Curve rating (see `self.rate_quality`)
         self._rating = None
 
+    def __setitem__(self, key, values):
+        # Make sure column data are stored in contiguous memory, such
+        # that the reductions in POC estimation and fitting operate on
+        # sequential buffers (no copy if `values` already is contiguous).
+        super(Indentation, self).__setitem__(key,
+                                             np.ascontiguousarray(values))
+
     @property
     def data(self):
         warnings.warn("Please use __getitem__ instead!", DeprecationWarning)
@@ -101,7 +107,11 @@ class Indentation(afmformats.AFMForceDistance):
 
         # remember preprocessing
         self.preprocessing = preprocessing
-        self.preprocessing_options = copy.deepcopy(options)
+        # The options are a dictionary of keyword-argument dictionaries
+        # with immutable values, so copying both levels is sufficient
+        # (and much cheaper than `copy.deepcopy`).
+        self.preprocessing_options = {pid: dict(kw)
+                                      for pid, kw in options.items()}
 
         return self._preprocessing_details
 
@@ -166,8 +176,9 @@ class Indentation(afmformats.AFMForceDistance):
 
         See the `poc` submodule for more information.
         """
-        idp = poc.compute_poc(force=np.array(self["force"], copy=True),
-                              method=method)
+        # The POC methods do not modify the force data, so there is
+        # no need to work on a copy.
+        idp = poc.compute_poc(force=self["force"], method=method)
         return idp
 
     def fit_model(self, **kwargs):
@@ -8,7 +8,7 @@ from . import model_sneddon_spherical_approximation  # noqa: F401
 
 from .core import NaniteFitModel  # noqa: F401
 from . import residuals  # noqa: F401
-from .logic import models_available, register_model
+from .logic import models_available, register_model, _models_by_name
 from .logic import deregister_model, load_model_from_file  # noqa: F401
 
 try:
@@ -84,8 +84,13 @@ def get_init_parms(model_key):
 
 def get_model_by_name(name):
     """Convenience function to obtain a model by name instead of by key"""
+    md = _models_by_name.get(name)
+    if md is not None and models_available.get(md.model_key) is md:
+        return md
+    # `models_available` might have been edited directly
     for key in models_available:
         if models_available[key].model_name == name:
+            _models_by_name[name] = models_available[key]
             return models_available[key]
     else:
         raise KeyError("No model with name '{}'!".format(name))
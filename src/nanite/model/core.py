@@ -69,8 +69,13 @@ class NaniteFitModel:
         # check for residuals function
         if not hasattr(self.module, "residual"):
             # use the default residual function
+            # (only the built-in models are flagged to always return
+            # a new array that may be overwritten with the residuals)
             self.module.residual = residuals.get_default_residuals_wrapper(
-                model_function=self.module.model_func)
+                model_function=self.module.model_func,
+                overwrite_model=getattr(self.module,
+                                        "_model_returns_new_array",
+                                        False))
 
         # check for modeling function
         if not hasattr(self.module, "model"):
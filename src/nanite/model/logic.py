@@ -1,4 +1,4 @@
-import importlib
+import importlib.util
 import pathlib
 import sys
 import warnings
@@ -7,6 +7,10 @@ from .core import ModelImportError, NaniteFitModel
 
 #: currently available models
 models_available = {}
+#: reverse lookup of `models_available` by model name
+_models_by_name = {}
+#: modules imported by `load_model_from_file` (by resolved path)
+_modules_by_path = {}
 
 
 def load_model_from_file(path, register=False):
@@ -32,25 +36,37 @@ def load_model_from_file(path, register=False):
     ModelImportError
         If the model cannot be imported
     """
-    path = pathlib.Path(path)
-    try:
-        # insert the plugin directory to sys.path so we can import it
+    path = pathlib.Path(path).resolve()
+    module = _modules_by_path.get(path)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(path.stem, path)
+        if spec is None or not path.exists():
+            raise ModelImportError(f"Could not import '{path}'!")
+        module = importlib.util.module_from_spec(spec)
+        # insert the plugin directory to sys.path so that the model
+        # can import other modules from there
         sys.path.insert(-1, str(path.parent))
+        # do not write bytecode to the (user's) model directory
+        dont_write_bytecode = sys.dont_write_bytecode
         sys.dont_write_bytecode = True
-        module = importlib.import_module(path.stem)
-    except ModuleNotFoundError:
-        raise ModelImportError(f"Could not import '{path}'!")
-    finally:
-        # undo our path insertion
-        sys.path.remove(str(path.parent))
-        sys.dont_write_bytecode = False
+        try:
+            spec.loader.exec_module(module)
+        except ModuleNotFoundError as e:
+            raise ModelImportError(f"Could not import '{path}'!") from e
+        finally:
+            # undo our path insertion
+            sys.path.remove(str(path.parent))
+            sys.dont_write_bytecode = dont_write_bytecode
+        sys.modules.setdefault(spec.name, module)
+        # loading the same file again yields the same module
+        _modules_by_path[path] = module
 
-        mod = NaniteFitModel(module)
+    mod = NaniteFitModel(module)
 
-        if register:
-            register_model(module)
+    if register:
+        register_model(module)
 
-        return mod
+    return mod
 
 
 def register_model(module, *args):
@@ -65,11 +81,26 @@ def register_model(module, *args):
     -------
     model: NaniteFitModel
         the corresponding NaniteFitModel instance
+
+    Raises
+    ------
+    ValueError
+        If a model from a different module (file) is already registered
+        with the same model key
     """
     if args:
         warnings.warn("Please only pass the module to `register_model`!",
                       DeprecationWarning)
     global models_available  # this is not necessary, but clarifies things
+    # do not silently replace other models with the same key
+    key = module.model_key
+    if key in models_available:
+        new_mod = (module.module if isinstance(module, NaniteFitModel)
+                   else module)
+        if not _is_same_module(models_available[key].module, new_mod):
+            raise ValueError(
+                f"A different model with the key '{key}' is already "
+                + "registered! Please deregister it first.")
     # add model
     if isinstance(module, NaniteFitModel):
         # we already have a fit model
@@ -77,11 +108,30 @@ def register_model(module, *args):
     else:
         md = NaniteFitModel(module)
     # the actual registration
-    models_available[module.model_key] = md
+    models_available[key] = md
+    # keep the first model registered under a name (same as linear search)
+    _models_by_name.setdefault(md.model_name, md)
     return md
 
 
+def _is_same_module(mod_a, mod_b):
+    """Whether two model modules originate from the same source
+
+    Modules are compared by their file, because the same model file
+    may be imported more than once (e.g. with :func:`importlib.reload`).
+    """
+    if mod_a is mod_b:
+        return True
+    file_a = getattr(mod_a, "__file__", None)
+    file_b = getattr(mod_b, "__file__", None)
+    return (file_a is not None and file_b is not None
+            and pathlib.Path(file_a).resolve()
+            == pathlib.Path(file_b).resolve())
+
+
 def deregister_model(model):
     """Deregister a NaniteFitModel"""
     global models_available  # this is not necessary, but clarifies things
-    models_available.pop(model.model_key)
+    md = models_available.pop(model.model_key)
+    if _models_by_name.get(md.model_name) is md:
+        _models_by_name.pop(md.model_name)
@@ -65,11 +65,42 @@ def hertz_conical(delta, E, alpha, nu, contact_point=0, baseline=0):
     Sneddon (1965) :cite:`Sneddon1965` (equation 6.4)
     """
     aa = 2*np.tan(alpha*pi/180)/pi * E/(1-nu**2)
-    root = contact_point-delta
-    pos = root > 0
-    bb = np.zeros_like(delta)
-    bb[pos] = root[pos]**2
-    return aa*bb + baseline
+    # Evaluate everything in-place in one floating point buffer
+    # (`delta` may also be a scalar or an integer array) that has
+    # the broadcast shape of all arguments.
+    shape = np.broadcast(delta, contact_point, aa, baseline).shape
+    bb = np.subtract(contact_point, delta, out=np.empty(
+        shape, dtype=np.result_type(contact_point, delta, 0.)))
+    # `np.fmax` sets all non-positive (and nan) values to zero.
+    np.fmax(bb, 0, out=bb)
+    np.square(bb, out=bb)
+    bb *= aa
+    bb += baseline
+    return bb
+
+
+def hertz_conical_batch(delta, E, alpha, nu, contact_point=0, baseline=0):
+    """Evaluate :func:`hertz_conical` for multiple curves at once
+
+    Parameters
+    ----------
+    delta: 2d ndarray of shape (N, M) or 1d ndarray of length M
+        Indentation [m] of N curves with M points each; a 1d array
+        is shared by all curves (e.g. for sweeping the contact point
+        of one curve)
+    E, alpha, nu, contact_point, baseline: float or 1d ndarray of length N
+        Model parameters for each curve (see :func:`hertz_conical`)
+
+    Returns
+    -------
+    F: 2d ndarray of shape (N, M)
+        Force [N]
+    """
+    # broadcast the parameters along the curve axis
+    E, alpha, nu, contact_point, baseline = [
+        np.reshape(pp, (-1, 1))
+        for pp in [E, alpha, nu, contact_point, baseline]]
+    return hertz_conical(delta, E, alpha, nu, contact_point, baseline)
 
 
 model_doc = hertz_conical.__doc__
@@ -82,3 +113,4 @@ parameter_names = ["Young's Modulus", "Half Cone Angle",
 parameter_units = ["Pa", "°", "", "m", "N"]
 valid_axes_x = ["tip position"]
 valid_axes_y = ["force"]
+_model_returns_new_array = True
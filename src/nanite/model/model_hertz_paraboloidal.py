@@ -93,11 +93,37 @@ def hertz_paraboloidal(delta, E, R, nu, contact_point=0, baseline=0):
     :cite:`LandauLifshitz` (§9 Solid bodies in contact, equation 9.14)
     """
     aa = 4/3 * E/(1-nu**2)*np.sqrt(R)
-    root = contact_point-delta
-    pos = root > 0
-    bb = np.zeros_like(delta)
-    bb[pos] = (root[pos])**(3/2)
-    return aa*bb + baseline
+    shape = np.broadcast(delta, contact_point, aa, baseline).shape
+    bb = np.subtract(contact_point, delta, out=np.empty(
+        shape, dtype=np.result_type(contact_point, delta, 0.)))
+    np.fmax(bb, 0, out=bb)
+    bb *= np.sqrt(bb)
+    bb *= aa
+    bb += baseline
+    return bb
+
+
+def hertz_paraboloidal_batch(delta, E, R, nu, contact_point=0, baseline=0):
+    """Evaluate :func:`hertz_paraboloidal` for multiple curves at once
+
+    Parameters
+    ----------
+    delta: 2d ndarray of shape (N, M) or 1d ndarray of length M
+        Indentation [m] of N curves with M points each; a 1d array
+        is shared by all curves (e.g. for sweeping the contact point
+        of one curve)
+    E, R, nu, contact_point, baseline: float or 1d ndarray of length N
+        Model parameters for each curve (see :func:`hertz_paraboloidal`)
+
+    Returns
+    -------
+    F: 2d ndarray of shape (N, M)
+        Force [N]
+    """
+    # broadcast the parameters along the curve axis
+    E, R, nu, contact_point, baseline = [
+        np.reshape(pp, (-1, 1)) for pp in [E, R, nu, contact_point, baseline]]
+    return hertz_paraboloidal(delta, E, R, nu, contact_point, baseline)
 
 
 model_doc = hertz_paraboloidal.__doc__
@@ -110,3 +136,4 @@ parameter_names = ["Young's Modulus", "Tip Radius",
 parameter_units = ["Pa", "m", "", "m", "N"]
 valid_axes_x = ["tip position"]
 valid_axes_y = ["force"]
+_model_returns_new_array = True
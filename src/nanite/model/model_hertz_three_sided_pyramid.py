@@ -63,11 +63,14 @@ def hertz_three_sided_pyramid(delta, E, alpha, nu, contact_point=0,
     Bilodeau et al. 1992 :cite:`Bilodeau:1992`
     """
     aa = 0.8887*np.tan(alpha*pi/180) * E/(1-nu**2)
-    root = contact_point-delta
-    pos = root > 0
-    bb = np.zeros_like(delta)
-    bb[pos] = (root[pos])**(2)
-    return aa*bb + baseline
+    shape = np.broadcast(delta, contact_point, aa, baseline).shape
+    bb = np.subtract(contact_point, delta, out=np.empty(
+        shape, dtype=np.result_type(contact_point, delta, 0.)))
+    np.fmax(bb, 0, out=bb)
+    np.square(bb, out=bb)
+    bb *= aa
+    bb += baseline
+    return bb
 
 
 model_doc = hertz_three_sided_pyramid.__doc__
@@ -80,3 +83,4 @@ parameter_names = ["Young's Modulus", "Face Angle",
 parameter_units = ["Pa", "°", "", "m", "N"]
 valid_axes_x = ["tip position"]
 valid_axes_y = ["force"]
+_model_returns_new_array = True
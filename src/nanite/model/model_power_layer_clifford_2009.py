@@ -85,31 +85,47 @@ def power_layer_clifford_2009(delta, E_S, E_L, R, nu_S, nu_L, t,
     ----------
     Clifford (2009) :cite:`Clifford2009` (equations 9 and 10)
     """
-    # Note that this code is optimized for readability, not for speed.
-    # roots of delta
-    root = contact_point - delta
-    pos = root > 0
-    dr12 = np.zeros_like(delta)
-    dr12[pos] = np.sqrt(root[pos])
-    dr32 = np.zeros_like(delta)
-    dr32[pos] = root[pos]**(3/2)
     # constants
     P = 2.25
-    n = 1.5
+    # n = 1.5 (see `pxin` below)
     m = 2/3
     B_S = 0.22
     B_L = 1.92
-    # inner term (equation 9)
-    a = np.sqrt(R) * dr12
-    xi = (a / t
-          * (E_L/E_S)**m
-          * (1 - B_S * nu_S**2) / (1 - B_L * nu_L**2)
-          )
+    # roots of delta (all non-positive indentations are set to zero
+    # so that every term below is computed in a single pass)
+    # All terms are computed in-place, which also preserves the data
+    # type of `delta` (e.g. float32). The buffer has the broadcast
+    # shape of all arguments.
+    shape = np.broadcast(delta, contact_point, E_S, E_L, R, nu_S, nu_L, t,
+                         baseline).shape
+    dr32 = np.subtract(contact_point, delta, out=np.empty(
+        shape, dtype=np.result_type(contact_point, delta, 0.)))
+    np.fmax(dr32, 0, out=dr32)
+    # (explicit `out` arrays, so that a 0d `delta` is not turned into
+    # an immutable scalar)
+    dr12 = np.sqrt(dr32, out=np.empty_like(dr32))
+    dr32 *= dr12
+    # inner term (equation 9), with all scalar factors combined
+    xi = dr12
+    xi *= (np.sqrt(R) / t
+           * (E_L/E_S)**m
+           * (1 - B_S * nu_S**2) / (1 - B_L * nu_L**2)
+           )
     # outer term for emodulus (equation 10)
-    E = E_L + (E_S - E_L) * (P * xi**n) / (1 + P * xi**n)
+    # (`xi**n` for n=3/2, `np.power` is much slower than `np.sqrt`)
+    pxin = xi
+    pxin *= np.sqrt(xi)
+    pxin *= P
+    E = np.add(pxin, 1, out=np.empty_like(pxin))
+    np.divide(pxin, E, out=E)
+    E *= E_S - E_L
+    E += E_L
     # original "hertz" first term
-    hertz = 4/3 * E * np.sqrt(R) * dr32
-    return hertz + baseline
+    hertz = E
+    hertz *= dr32
+    hertz *= 4/3 * np.sqrt(R)
+    hertz += baseline
+    return hertz
 
 
 model_doc = power_layer_clifford_2009.__doc__
@@ -125,3 +141,4 @@ parameter_names = ["Sample Young's Modulus", "Layer Young's Modulus",
 parameter_units = ["Pa", "Pa", "m", "", "", "m", "m", "N"]
 valid_axes_x = ["tip position"]
 valid_axes_y = ["force"]
+_model_returns_new_array = True
@@ -77,16 +77,25 @@ def hertz_sneddon_spherical_approx(delta, E, R, nu, contact_point=0,
     Dobler (personal communication, 2018) :cite:`Dobler`
     """
     aa = 4/3 * E/(1-nu**2)*np.sqrt(R)
-    root = contact_point-delta
-    pos = root > 0
-    bb = np.zeros_like(delta)
-    bb[pos] = (root[pos])**(3/2)*(
-        + 1
-        - 1/10*(root[pos]/R)
-        - 1/840*(root[pos]/R)**2
-        + 11/15120*(root[pos]/R)**3
-        + 1357/6652800*(root[pos]/R)**4)
-    return aa*bb + baseline
+    shape = np.broadcast(delta, contact_point, aa, baseline).shape
+    root = np.subtract(contact_point, delta, out=np.empty(
+        shape, dtype=np.result_type(contact_point, delta, 0.)))
+    np.fmax(root, 0, out=root)
+    uu = root * (1/R)
+    # power series in Horner form
+    bb = 1357/6652800 * uu
+    bb += 11/15120
+    bb *= uu
+    bb -= 1/840
+    bb *= uu
+    bb -= 1/10
+    bb *= uu
+    bb += 1
+    bb *= root
+    bb *= np.sqrt(root, out=root)
+    bb *= aa
+    bb += baseline
+    return bb
 
 
 model_doc = hertz_sneddon_spherical_approx.__doc__
@@ -99,3 +108,4 @@ parameter_names = ["Young's Modulus", "Tip Radius",
 parameter_units = ["Pa", "m", "", "m", "N"]
 valid_axes_x = ["tip position"]
 valid_axes_y = ["force"]
+_model_returns_new_array = True
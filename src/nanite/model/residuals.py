@@ -1,8 +1,12 @@
 import numpy as np
 
 
-def get_default_residuals_wrapper(model_function):
-    """Return a wrapper around the default nanite residual function"""
+def get_default_residuals_wrapper(model_function, overwrite_model=False):
+    """Return a wrapper around the default nanite residual function
+
+    Set `overwrite_model` to True only if `model_function` always
+    returns a new array (see :func:`residual`).
+    """
     default_modeling_wrapper = get_default_modeling_wrapper(model_function)
 
     def default_residuals_wrapper(params, delta, force, weight_cp=5e-7):
@@ -10,7 +14,8 @@ def get_default_residuals_wrapper(model_function):
                         delta=delta,
                         force=force,
                         model=default_modeling_wrapper,
-                        weight_cp=weight_cp)
+                        weight_cp=weight_cp,
+                        overwrite_model=overwrite_model)
 
     return default_residuals_wrapper
 
@@ -29,22 +34,18 @@ def model_direction_agnostic(model_function, params, delta):
 
     TODO: Re-evaluate usefulness of this method.
     """
-    if delta[0] < delta[-1]:
-        revert = True
-    else:
-        revert = False
+    # Reversing is only a strided view, no data are copied.
+    revert = delta[0] < delta[-1]
     if revert:
         delta = delta[::-1]
 
     mf = model_function(delta=delta, **params.valuesdict())
 
-    if revert:
-        return mf[::-1]
-    else:
-        return mf
+    return mf[::-1] if revert else mf
 
 
-def residual(params, delta, force, model, weight_cp=5e-7):
+def residual(params, delta, force, model, weight_cp=5e-7,
+             overwrite_model=False):
     """Compute residuals for fitting
 
     Parameters
@@ -62,9 +63,22 @@ def residual(params, delta, force, model, weight_cp=5e-7):
         The distance from the contact point until which
         linear weights will be applied. Set to zero to
         disable weighting.
+    overwrite_model: bool
+        Whether the array returned by `model` may be overwritten
+        with the residuals (only set this if `model` always returns
+        a new array)
     """
     md = model(params, delta)
-    resid = force - md
+    if (overwrite_model
+            and isinstance(md, np.ndarray)
+            and md.shape == force.shape
+            and md.dtype == force.dtype):
+        # The model output is not used anywhere else (this includes
+        # the reversed view from `model_direction_agnostic`), so we
+        # can reuse its buffer instead of allocating a new array.
+        resid = np.subtract(force, md, out=md)
+    else:
+        resid = force - md
 
     if weight_cp:
         # weight the curve so that the data around the contact_point do
@@ -77,7 +91,7 @@ def residual(params, delta, force, model, weight_cp=5e-7):
     return resid
 
 
-def compute_contact_point_weights(cp, delta, weight_dist=5e-7):
+def compute_contact_point_weights(cp, delta, weight_dist=5e-7, out=None):
     """Compute contact point weights
 
     Parameters
@@ -88,6 +102,8 @@ def compute_contact_point_weights(cp, delta, weight_dist=5e-7):
         The indentation array along which weights will be computed.
     weight_width: float
         The distance from `cp` until which weights will be applied.
+    out: 1d ndarray of length N
+        Optional output array; if not given, a new array is allocated.
 
     Returns
     -------
@@ -102,7 +118,8 @@ def compute_contact_point_weights(cp, delta, weight_dist=5e-7):
     """
     # weights are proportional to distance from contact point
     # normalized by weight_width.
-    x = np.abs(delta-cp)
-    x /= weight_dist
-    x[x > 1] = 1
+    x = np.subtract(delta, cp, out=out)
+    np.abs(x, out=x)
+    x *= 1 / weight_dist
+    np.minimum(x, 1, out=x)
     return x
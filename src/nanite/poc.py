@@ -7,6 +7,9 @@ from scipy.ndimage import uniform_filter1d
 #: List of all methods available for contact point estimation
 POC_METHODS = []
 
+#: POC methods by identifier (for fast lookup in :func:`compute_poc`)
+_poc_methods_by_id = {}
+
 
 def compute_preproc_clip_approach(force):
     """Clip the approach part (discard the retract part)
@@ -14,8 +17,9 @@ def compute_preproc_clip_approach(force):
     This POC preprocessing method may be applied before
     applying the POC estimation method.
     """
-    # get data
-    fg0 = np.array(force, copy=True)
+    # get data (the POC methods do not modify the force, so
+    # there is no need to copy it)
+    fg0 = np.asarray(force)
     # Only use the (initial) approach part of the curve.
     idmax = np.argmax(fg0)
     fg = fg0[:idmax]
@@ -27,8 +31,8 @@ def compute_poc(force, method="deviation_from_baseline", ret_details=False):
 
     Parameters
     ----------
-    force: 1d ndarray
-        Force data
+    force: 1d array-like
+        Force data (converted to a contiguous float64 array)
     method: str
         Name of the method for computing the POC (see :const:`POC_METHODS`)
     ret_details: bool
@@ -40,20 +44,21 @@ def compute_poc(force, method="deviation_from_baseline", ret_details=False):
     If the POC method returns np.nan, then the center of the
     force data is returned (to allow fitting algorithms to proceed).
     """
+    # Convert the data once, so that the POC methods (and the scipy/lmfit
+    # routines they call) do not each make their own converted copy.
+    force = np.ascontiguousarray(force, dtype=float)
     # compute POC according to method chosen
-    for mfunc in POC_METHODS:
-        if mfunc.identifier == method:
-            if "clip_approach" in mfunc.preprocessing:
-                force = compute_preproc_clip_approach(force)
-            data = mfunc(force, ret_details=ret_details)
-            if ret_details:
-                cp, details = data
-                details["method"] = method
-            else:
-                cp, details = data, None
-            break
-    else:
+    mfunc = _poc_methods_by_id.get(method)
+    if mfunc is None:
         raise ValueError(f"Undefined POC method '{method}'!")
+    if "clip_approach" in mfunc.preprocessing:
+        force = compute_preproc_clip_approach(force)
+    data = mfunc(force, ret_details=ret_details)
+    if ret_details:
+        cp, details = data
+        details["method"] = method
+    else:
+        cp, details = data, None
     if np.isnan(cp):
         cp = force.size // 2
     if ret_details:
@@ -87,6 +92,7 @@ def poc(identifier, name, preprocessing):
         wraps the preprocessor.
         """
         POC_METHODS.append(func)
+        _poc_methods_by_id[identifier] = func
         func.identifier = identifier
         func.name = name
         func.preprocessing = preprocessing
@@ -109,11 +115,13 @@ def poc_deviation_from_baseline(force, ret_details=False):
     cp = np.nan
     details = {}
     # Crop the slow approach trace (10% of the curve)
-    baseline = force[:int(force.size * .1)]
+    baseline = force[:force.size // 10]
     if baseline.size:
         bl_avg = np.average(baseline)
-        bl_rng = np.max(np.abs(baseline - bl_avg)) * 2
-        bl_dev = (force - bl_avg) > bl_rng
+        # maximum absolute deviation (without a temporary array)
+        bl_rng = max(np.max(baseline) - bl_avg, bl_avg - np.min(baseline)) * 2
+        # compare with the absolute threshold (no temporary array)
+        bl_dev = force > bl_avg + bl_rng
         # argmax gets the first largest value
         maxid = np.argmax(bl_dev)
         if bl_dev[maxid]:
@@ -155,15 +163,19 @@ def poc_fit_constant_line(force, ret_details=False):
     fitting parameter).
     """
     def model(params, x):
-        d = params["d"]
-        x0 = params["x0"]
-        m = params["m"]
-        one = d
-        two = m * (x - x0) + d
-        return np.maximum(one, two)
+        pv = params.valuesdict()
+        d = pv["d"]
+        x0 = pv["x0"]
+        m = pv["m"]
+        # evaluate the line in-place and clip it at the baseline
+        curve = x - x0
+        curve *= m
+        curve += d
+        return np.maximum(curve, d, out=curve)
 
     def residual(params, x, data):
-        return data - model(params, x)
+        curve = model(params, x)
+        return np.subtract(data, curve, out=curve)
 
     cp = np.nan
     details = {}
@@ -172,9 +184,10 @@ def poc_fit_constant_line(force, ret_details=False):
         fmin = np.min(force)
         fptp = np.max(force) - fmin
         y = (force - fmin) / fptp
-        x = np.arange(y.size)
-        # get estimate for cp
-        x0 = poc_frechet_direct_path(force)
+        x = np.arange(y.size, dtype=float)
+        # get estimate for cp (same as `poc_frechet_direct_path(force)`,
+        # but reusing the normalized force)
+        x0 = np.argmin(_rotate_normalized_curve(y.copy()))
         if np.isnan(x0):
             x0 = y.size // 2
         params = lmfit.Parameters()
@@ -234,19 +247,21 @@ def poc_fit_constant_polynomial(force, ret_details=False):
     fitting parameter).
     """
     def model(params, x):
-        d = params["d"].value
-        x0 = params["x0"].value
-        a = params["a"].value
-        b = params["b"].value
-        c = params["c"].value
-        x1 = x - x0
-        curve = x1**3 / (a*x1**2 + b*x1 + c) + d
-        curve[x1 <= 0] = d
+        pv = params.valuesdict()
+        d = pv["d"]
+        x0 = pv["x0"]
+        a = pv["a"]
+        b = pv["b"]
+        c = pv["c"]
+        # The polynomial only contributes for positive `x1` (the
+        # denominator is written in Horner form).
+        x1 = np.fmax(x - x0, 0)
+        curve = x1 * x1 * x1 / (c + x1 * (b + a * x1)) + d
         return curve
 
     def residual(params, x, data):
         curve = model(params, x)
-        return data - curve
+        return np.subtract(data, curve, out=curve)
 
     cp = np.nan
     details = {}
@@ -254,8 +269,9 @@ def poc_fit_constant_polynomial(force, ret_details=False):
         fmin = np.min(force)
         fptp = np.max(force) - fmin
         y = (force - fmin) / fptp
-        x = np.arange(y.size)
-        x0 = poc_frechet_direct_path(force)
+        x = np.arange(y.size, dtype=float)
+        # same as `poc_frechet_direct_path(force)`
+        x0 = np.argmin(_rotate_normalized_curve(y.copy()))
         if np.isnan(x0):
             x0 = y.size // 2
         params = lmfit.Parameters()
@@ -333,20 +349,23 @@ def poc_fit_line_polynomial(force, ret_details=False):
     poc_fit_constant_polynomial: polynomial-only version
     """
     def model(params, x):
-        d = params["d"].value
-        x0 = params["x0"].value
-        m = params["m"].value
-        a = params["a"].value
-        b = params["b"].value
-        c = params["c"].value
+        pv = params.valuesdict()
+        d = pv["d"]
+        x0 = pv["x0"]
+        m = pv["m"]
+        a = pv["a"]
+        b = pv["b"]
+        c = pv["c"]
         x1 = x - x0
-        curve = m * x1 + d
-        curve[x1 > 0] += x1[x1 > 0]**3 / (a*x1[x1 > 0]**2 + b*x1[x1 > 0] + c)
+        # The polynomial only contributes for positive `x1` (the
+        # denominator is written in Horner form).
+        x1p = np.fmax(x1, 0)
+        curve = m * x1 + d + x1p * x1p * x1p / (c + x1p * (b + a * x1p))
         return curve
 
     def residual(params, x, data):
         curve = model(params, x)
-        return data - curve
+        return np.subtract(data, curve, out=curve)
 
     cp = np.nan
     details = {}
@@ -354,8 +373,9 @@ def poc_fit_line_polynomial(force, ret_details=False):
         fmin = np.min(force)
         fptp = np.max(force) - fmin
         y = (force - fmin) / fptp
-        x = np.arange(y.size)
-        x0 = poc_frechet_direct_path(force)
+        x = np.arange(y.size, dtype=float)
+        # same as `poc_frechet_direct_path(force)`
+        x0 = np.argmin(_rotate_normalized_curve(y.copy()))
         if np.isnan(x0):
             x0 = y.size // 2
         params = lmfit.Parameters()
@@ -410,14 +430,10 @@ def poc_frechet_direct_path(force, ret_details=False):
     contact point. For shorter baselines, the contact point will
     be closer to the point of maximum indentation.
     """
-    x = np.linspace(0, 1, len(force), endpoint=True)
-    y = (force - force.min()) / (force.max() - force.min())
-
-    # rotate the curve towards x
-    # (computation of Frechet distance with curve is now just distance
-    # from x-axis, i.e. minimum)
-    alpha = - np.pi / 4
-    yr = x * np.sin(alpha) + y * np.cos(alpha)
+    fmin = force.min()
+    y = np.subtract(force, fmin, dtype=float)
+    y /= force.max() - fmin
+    yr = _rotate_normalized_curve(y)
     cp = np.argmin(yr)
 
     if ret_details:
@@ -432,6 +448,23 @@ def poc_frechet_direct_path(force, ret_details=False):
         return cp
 
 
+def _rotate_normalized_curve(y):
+    """Rotate normalized force data towards the x-axis (in-place)
+
+    Helper for :func:`poc_frechet_direct_path`. The force data `y`
+    must be normalized to the range [0, 1] and are overwritten.
+    """
+    x = np.linspace(0, 1, len(y), endpoint=True)
+    # rotate the curve towards x
+    # (computation of Frechet distance with curve is now just distance
+    # from x-axis, i.e. minimum)
+    # (computed in-place in the buffers of `x` and `y`)
+    alpha = - np.pi / 4
+    x *= np.sin(alpha)
+    y *= np.cos(alpha)
+    return np.add(x, y, out=y)
+
+
 @poc(identifier="gradient_zero_crossing",
      name="Gradient zero-crossing of indentation part",
      preprocessing=["clip_approach"])
@@ -449,18 +482,28 @@ def poc_gradient_zero_crossing(force, ret_details=False):
     cp = np.nan
     details = {}
     # Perform a median filter to smooth the array
-    filtsize = max(5, int(force.size*.01))
+    filtsize = max(5, force.size // 100)
     y = uniform_filter1d(force, size=filtsize)
     if y.size > 1:
         # Cutoff at maximum plus some reserve
         cutoff = y.size - np.argmax(y) + 10
-        grad = np.gradient(y)[:-cutoff]
+        # Only compute the gradient in the region before the cutoff
+        # (same as `np.gradient(y)[:-cutoff]`, but written directly
+        # into a buffer of the trimmed size): forward difference at
+        # the first index and central differences for all others.
+        size = max(y.size - cutoff, 0)
+        grad = np.empty(size)
+        if size:
+            grad[0] = y[1] - y[0]
+            np.subtract(y[2:size + 1], y[:size - 1], out=grad[1:])
+            grad[1:] /= 2
         if grad.size > 50:
             # Use the point where the gradient becomes small enough.
-            gradn = uniform_filter1d(grad, size=filtsize)
+            # (the gradient is not needed anymore, filter it in-place)
+            gradn = uniform_filter1d(grad, size=filtsize, output=grad)
             thresh = 0.01 * np.max(gradn)
             gradpos = gradn <= thresh
-            if np.sum(gradpos):
+            if gradpos.any():
                 # The gradient contains positive values.
                 # Flip `gradpos`, because we want the first value from the
                 # end of the array.
@@ -468,7 +511,8 @@ def poc_gradient_zero_crossing(force, ret_details=False):
                 # want the rolling median filter from the edge and not at the
                 # center of the array (and two times, because we did two
                 # filter operations).
-                cp = y.size - np.where(gradpos[::-1])[0][0] - cutoff + filtsize
+                # (argmax stops at the first True value)
+                cp = y.size - np.argmax(gradpos[::-1]) - cutoff + filtsize
 
                 if ret_details:
                     # scale the gradient so that it aligns with the force
@@ -1,4 +1,3 @@
-import copy
 import inspect
 import functools
 import warnings
@@ -13,6 +12,9 @@ from .smooth import smooth_axis_monotone
 #: Available preprocessors
 PREPROCESSORS = []
 
+#: Preprocessors by identifier (for fast lookup in :func:`get_func`)
+_preprocessors_by_id = {}
+
 
 class CannotSplitWarning(UserWarning):
     pass
@@ -49,17 +51,16 @@ def apply(apret, identifiers=None, options=None, ret_details=False,
     # implemented on the other side in `indent.py` (2021-08-16).
     apret.reset_data()
     for ii, pid in enumerate(identifiers):
-        if pid in available():
-            meth = get_func(pid)
+        meth = _preprocessors_by_id.get(pid)
+        if meth is not None:
             req = meth.steps_required
-            act = identifiers[:ii]
-            if req is not None and ((set(req) & set(act)) != set(req)):
+            if req is not None and not set(req).issubset(identifiers[:ii]):
                 raise ValueError(f"The preprocessing step '{pid}' requires"
-                                 f" the steps {meth.steps_required}!")
+                                 f" the steps {req}!")
             # create a copy of the dictionary (if it exists) so that
             # `ret_details` is not written to it
-            kwargs = copy.deepcopy(options.get(pid, {}))
-            if "ret_details" in inspect.signature(meth).parameters:
+            kwargs = dict(options.get(pid, {}))
+            if meth.accepts_ret_details:
                 # only set `ret_details` if method accepts it
                 kwargs["ret_details"] = ret_details
             details[pid] = meth(apret, **kwargs)
@@ -75,7 +76,13 @@ def autosort(identifiers):
 
     This takes into account `steps_required` and `steps_optional`.
     """
-    sorted_identifiers = copy.copy(identifiers)
+    return list(_autosort(tuple(identifiers)))
+
+
+@functools.lru_cache(maxsize=64)
+def _autosort(identifiers):
+    """Cached implementation of :func:`autosort` (for tuples)"""
+    sorted_identifiers = list(identifiers)
     for pid in identifiers:
         meth = get_func(pid)
         steps_precursor = []
@@ -98,7 +105,7 @@ def autosort(identifiers):
     # Perform a sanity check
     check_order(sorted_identifiers)
 
-    return sorted_identifiers
+    return tuple(sorted_identifiers)
 
 
 @functools.lru_cache()
@@ -114,7 +121,7 @@ def check_order(identifiers):
         meth = get_func(pid)
         if meth.steps_required:
             rix = [identifiers.index(r) for r in meth.steps_required]
-            if np.any(np.array(rix) > cix):
+            if max(rix) > cix:
                 raise ValueError(
                     f"Wrong required step order for {pid}: {identifiers}!")
         if meth.steps_optional:
@@ -122,7 +129,7 @@ def check_order(identifiers):
             for rr in meth.steps_optional:
                 if rr in identifiers:
                     rio.append(identifiers.index(rr))
-            if np.any(np.array(rio) > cix):
+            if rio and max(rio) > cix:
                 raise ValueError(
                     f"Wrong optional step order for {pid}: {identifiers}!")
 
@@ -136,34 +143,37 @@ def find_turning_point(tip_position, force, contact_point_index):
     minimum and maximum values. This is necessary, because they
     live on different orders of magnitudes/units.
     """
-    x = np.copy(tip_position)
-    y = np.copy(force)
     idp = contact_point_index
 
     # Flip and normalize tip position so that maximum is at minimum
     # z-position (set to 1) which coincides with maximum indentation.
-    x -= x[idp]
+    # (The input arrays are not modified, all operations below are
+    # performed in-place on `x` and `y`.)
+    x = np.subtract(tip_position, tip_position[idp])
     xmin = x.min()
     if xmin != 0:
-        x /= x.min()
-    x[x < 0] = 0
+        x /= xmin
+    np.maximum(x, 0, out=x)
 
     # Flip and normalize force so that maximum force is set to 1.
-    y -= np.average(y[:idp])
+    y = np.subtract(force, np.average(force[:idp]))
     y /= y.max()
     y[y < np.std(y[:idp])] = 0
 
-    idturn = np.argmax(x ** 2 + y ** 2)
+    # squared distance
+    x *= x
+    y *= y
+    x += y
+    idturn = np.argmax(x)
     return idturn
 
 
 def get_func(identifier):
     """Return preprocessor function for identifier"""
-    for func in PREPROCESSORS:
-        if func.identifier == identifier:
-            return func
-    else:
-        raise KeyError(f"Preprocessor '{identifier}' unknown!")
+    try:
+        return _preprocessors_by_id[identifier]
+    except KeyError:
+        raise KeyError(f"Preprocessor '{identifier}' unknown!") from None
 
 
 def get_name(identifier):
@@ -216,7 +226,11 @@ def preprocessing_step(identifier, name, steps_required=None,
         func.options = options
         func.steps_required = steps_required
         func.steps_optional = steps_optional
+        # `apply` only passes `ret_details` if the method accepts it
+        func.accepts_ret_details = \
+            "ret_details" in inspect.signature(func).parameters
         PREPROCESSORS.append(func)
+        _preprocessors_by_id[identifier] = func
         return func
 
     return attribute_setter
@@ -266,12 +280,14 @@ def preproc_compute_tip_position(apret):
 def preproc_correct_force_offset(apret):
     """Correct the force offset with an average baseline value
     """
-    idp = poc.compute_poc(force=apret["force"],
+    # Only access the column once (AFMData may return a copy).
+    force = apret["force"]
+    idp = poc.compute_poc(force=force,
                           method="deviation_from_baseline")
     if idp:
-        apret["force"] = apret["force"] - np.average(apret["force"][:idp])
+        apret["force"] = force - force[:idp].mean()
     else:
-        apret["force"] = apret["force"] - apret["force"][0]
+        apret["force"] = force - force[0]
 
 
 @preprocessing_step(identifier="correct_force_slope",
@@ -411,8 +427,8 @@ def preproc_correct_tip_offset(apret, method="deviation_from_baseline",
         cpid, details = data
     else:
         cpid, details = data, None
-    apret["tip position"] = (apret["tip position"]
-                             - apret["tip position"][cpid])
+    tip_position = apret["tip position"]
+    apret["tip position"] = tip_position - tip_position[cpid]
     return details
 
 
@@ -487,11 +503,11 @@ def preproc_smooth_height(apret):
 
 
 def _deprecate_call(method):
+    msg = ("Using `IndentationPreprocessor` class is deprecated, please use "
+           f"the method '{method.__module__}.{method.__name__}' instead!")
+
     def wrapper(*args, **kwargs):
-        warnings.warn(
-            "Using `IndentationPreprocessor` class is deprecated, please use "
-            f"the method '{method.__module__}.{method.__name__}' instead!",
-            DeprecationWarning)
+        warnings.warn(msg, DeprecationWarning, stacklevel=2)
         return method(*args, **kwargs)
     return wrapper
 
@@ -42,7 +42,7 @@ class IndentationFeatures(object):
     @property
     def datafit_apr(self):
         seg = self.dataset["segment"] == 0
-        f = self.dataset["fit"][seg].copy()
+        f = self.dataset["fit"][seg]
         return f
 
     @property
@@ -53,7 +53,7 @@ class IndentationFeatures(object):
     def datax_apr(self):
         xaxis = self.dataset.fit_properties["x_axis"]
         seg = self.dataset["segment"] == 0
-        x = self.dataset[xaxis][seg].copy()
+        x = self.dataset[xaxis][seg]
         # Make sure everything is ok
         assert x[0] > x[-1], "Approach from large distances towards lower"
         return x
@@ -62,7 +62,7 @@ class IndentationFeatures(object):
     def datay_apr(self):
         yaxis = self.dataset.fit_properties["y_axis"]
         seg = self.dataset["segment"] == 0
-        y = self.dataset[yaxis][seg].copy()
+        y = self.dataset[yaxis][seg]
         return y
 
     @property
@@ -52,22 +52,15 @@ def smooth_axis_monotone(data, window=15, max_iter=1000):
         raise ValueError("Reached `max_iter`={}".format(max_iter))
 
     for _ in range(max_iter):
-        if np.unique(smooth).size == smooth.size:
+        # indices of values that are equal to their predecessor
+        same = np.flatnonzero(smooth[1:] == smooth[:-1]) + 1
+        if same.size == 0 and np.unique(smooth).size == smooth.size:
             break
         # Keep axis monotonous.
-        # get the first element with equal values
-        equal = []
-        myset = False
-        for ii in range(smooth.size):
-            if smooth[ii+1] == smooth[ii]:
-                equal.append(ii+1)
-                myset = True
-            elif myset is True:
-                # continue with these values in the next for-loop
-                break
-            if smooth.size == ii+2:
-                # abort
-                break
+        # get the first consecutive run of equal values
+        gaps = np.flatnonzero(np.diff(same) != 1)
+        stop = gaps[0] + 1 if gaps.size else same.size
+        equal = same[:stop].tolist()
 
         for count, idx in enumerate(equal):
             try:
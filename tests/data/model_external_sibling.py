@@ -0,0 +1,15 @@
+# This model imports its model function from a module in the same directory
+from model_external_sibling_helper import (  # noqa: F401
+    get_parameter_defaults, hertz_paraboloidal)
+
+
+model_doc = hertz_paraboloidal.__doc__
+model_func = hertz_paraboloidal
+model_key = "hans_peter_sibling"
+model_name = "Hans Peter's sibling model"
+parameter_keys = ["E", "R", "nu", "contact_point", "baseline"]
+parameter_names = ["Young's Modulus", "Tip Radius",
+                   "Poisson's Ratio", "Contact Point", "Force Baseline"]
+parameter_units = ["Pa", "m", "", "m", "N"]
+valid_axes_x = ["tip position"]
+valid_axes_y = ["force"]
@@ -71,6 +71,16 @@ def test_basic():
     assert idnt["tip position"][0] == 4.765854684370548e-06
 
 
+def test_contiguous_column_data():
+    ds1 = nanite.IndentationGroup(jpkfile)
+    idnt = ds1[0]
+    force = np.repeat(idnt["force"], 2)[::2]
+    assert not force.flags["C_CONTIGUOUS"]
+    idnt["force"] = force
+    assert idnt["force"].flags["C_CONTIGUOUS"]
+    assert np.all(idnt["force"] == force)
+
+
 def test_export():
     ds1 = nanite.IndentationGroup(jpkfile)
     idnt = ds1[0]
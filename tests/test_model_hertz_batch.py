@@ -0,0 +1,63 @@
+"""Test of batch evaluation of the Hertz models"""
+import numpy as np
+import pytest
+
+from nanite.model import model_conical_indenter, model_hertz_paraboloidal
+
+
+BATCH_MODELS = [
+    (model_conical_indenter.hertz_conical,
+     model_conical_indenter.hertz_conical_batch,
+     np.array([25, 30, 15])),  # alpha
+    (model_hertz_paraboloidal.hertz_paraboloidal,
+     model_hertz_paraboloidal.hertz_paraboloidal_batch,
+     np.array([1e-05, 2e-05, 5e-06])),  # R
+]
+
+
+@pytest.mark.parametrize("func,batch_func,geometry", BATCH_MODELS)
+def test_hertz_batch(func, batch_func, geometry):
+    delta = np.linspace(-2e-6, 2e-6, 100)
+    deltas = np.array([delta, delta[::-1], delta + 1e-7])
+    E = np.array([3e3, 5e3, 1e2])
+    contact_point = np.array([0, 1e-7, -1e-7])
+    batch = batch_func(deltas, E, geometry, .5, contact_point, 1e-9)
+    assert batch.shape == (3, 100)
+    for ii in range(3):
+        single = func(deltas[ii], E[ii], geometry[ii], .5,
+                      contact_point[ii], 1e-9)
+        assert np.allclose(batch[ii], single, rtol=1e-14, atol=0)
+
+
+@pytest.mark.parametrize("func,batch_func,geometry", BATCH_MODELS)
+def test_hertz_batch_contact_point_sweep(func, batch_func, geometry):
+    delta = np.linspace(-2e-6, 2e-6, 100)
+    force = func(delta, 3e3, geometry[0], .5, 2e-7, 1e-9)
+    cps = np.linspace(-1e-6, 1e-6, 21)
+    # (21, 100) force surface from a shared indentation array
+    grid = batch_func(delta, 3e3, geometry[0], .5, cps, 1e-9)
+    assert grid.shape == (21, 100)
+    best = np.argmin(np.sum((grid - force)**2, axis=1))
+    assert np.isclose(cps[best], 2e-7, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("func,batch_func,geometry", BATCH_MODELS)
+def test_hertz_batch_per_curve_emodulus(func, batch_func, geometry):
+    delta = np.linspace(-2e-6, 2e-6, 10)
+    E = np.array([1e3, 2e3, 3e3])
+    batch = batch_func(delta, E, geometry[0], .5, 0, 0)
+    assert batch.shape == (3, 10)
+    for ii in range(3):
+        single = func(delta, E[ii], geometry[0], .5, 0, 0)
+        assert np.allclose(batch[ii], single, rtol=1e-14, atol=0)
+
+
+@pytest.mark.parametrize("func,batch_func,geometry", BATCH_MODELS)
+def test_hertz_batch_per_curve_baseline(func, batch_func, geometry):
+    delta = np.linspace(-2e-6, 2e-6, 10)
+    baseline = np.array([0, 1e-9, -1e-9])
+    batch = batch_func(delta, 3e3, geometry[0], .5, 0, baseline)
+    assert batch.shape == (3, 10)
+    for ii in range(3):
+        single = func(delta, 3e3, geometry[0], .5, 0, baseline[ii])
+        assert np.allclose(batch[ii], single, rtol=1e-14, atol=0)
@@ -1,7 +1,13 @@
+import importlib.util
 import pathlib
+import sys
+
+import pytest
 
 import nanite
 
+from common import MockModelModule
+
 
 data_dir = pathlib.Path(__file__).parent / "data"
 
@@ -15,6 +21,41 @@ def test_load_model_from_file():
     assert md.model_key not in nanite.model.models_available
 
 
+def test_load_model_from_file_twice():
+    mpath = data_dir / "model_external_basic.py"
+    md = nanite.model.load_model_from_file(mpath, register=True)
+    md2 = nanite.model.load_model_from_file(mpath, register=True)
+    assert md.module is md2.module
+    assert nanite.model.models_available[md.model_key].module is md.module
+    nanite.model.deregister_model(md)
+    assert md.model_key not in nanite.model.models_available
+
+
+def test_load_model_from_file_sibling_import():
+    mpath = data_dir / "model_external_sibling.py"
+    syspath = list(sys.path)
+    md = nanite.model.load_model_from_file(mpath, register=False)
+    assert md.model_key == "hans_peter_sibling"
+    assert sys.path == syspath
+
+
+def test_load_model_from_file_missing():
+    mpath = data_dir / "model_does_not_exist.py"
+    with pytest.raises(nanite.model.core.ModelImportError,
+                       match="Could not import"):
+        nanite.model.load_model_from_file(mpath)
+
+
+def test_load_model_from_file_no_side_effects():
+    mpath = data_dir / "model_external_basic.py"
+    syspath = list(sys.path)
+    dont_write_bytecode = sys.dont_write_bytecode
+    md = nanite.model.load_model_from_file(mpath, register=False)
+    assert md.model_key == "hans_peter"
+    assert sys.path == syspath
+    assert sys.dont_write_bytecode == dont_write_bytecode
+
+
 def test_load_model_from_model():
     mpath = data_dir / "model_external_basic.py"
     md = nanite.model.load_model_from_file(mpath, register=False)
@@ -25,3 +66,29 @@ def test_load_model_from_model():
     assert md.model_key in nanite.model.models_available
     nanite.model.deregister_model(md)
     assert md.model_key not in nanite.model.models_available
+
+
+def test_get_model_by_name():
+    mpath = data_dir / "model_external_basic.py"
+    md = nanite.model.load_model_from_file(mpath, register=True)
+    md2 = nanite.model.get_model_by_name(md.model_name)
+    assert md2.model_key == md.model_key
+    nanite.model.deregister_model(md)
+    with pytest.raises(KeyError, match="Hans Peter"):
+        nanite.model.get_model_by_name(md.model_name)
+
+
+def test_register_model_collision():
+    mpath = data_dir / "model_external_basic.py"
+    md = nanite.model.load_model_from_file(mpath, register=True)
+    # registering the same module again is fine
+    nanite.model.register_model(md.module)
+    # also if the model file was imported again
+    spec = importlib.util.spec_from_file_location("reimported", mpath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    nanite.model.register_model(module)
+    # a different module with the same key is not
+    with pytest.raises(ValueError, match="already registered"):
+        nanite.model.register_model(MockModelModule(model_key=md.model_key))
+    nanite.model.deregister_model(md)
@@ -0,0 +1,70 @@
+import lmfit
+import numpy as np
+import pytest
+
+from nanite.model import residuals
+
+
+def test_compute_contact_point_weights():
+    delta = np.linspace(-2e-6, 2e-6, 9)
+    weights = residuals.compute_contact_point_weights(
+        cp=0, delta=delta, weight_dist=1e-6)
+    assert np.allclose(weights, [1, 1, 1, .5, 0, .5, 1, 1, 1])
+
+
+def test_compute_contact_point_weights_out():
+    delta = np.linspace(-2e-6, 2e-6, 9)
+    out = np.empty_like(delta)
+    weights = residuals.compute_contact_point_weights(
+        cp=1e-6, delta=delta, weight_dist=1e-6, out=out)
+    assert weights is out
+    assert np.allclose(out, [1, 1, 1, 1, 1, .5, 0, .5, 1])
+    # input data must not be modified
+    assert np.allclose(delta, np.linspace(-2e-6, 2e-6, 9))
+
+
+def test_residual_does_not_modify_model_output():
+    params = lmfit.Parameters()
+    params.add("contact_point", value=0)
+    delta = np.linspace(-2e-6, 2e-6, 9)
+    force = np.linspace(0, 1, 9)
+    cached = np.ones(9)
+
+    def model(params, delta):
+        return cached
+
+    resid = residuals.residual(params, delta, force, model, weight_cp=0)
+    assert np.allclose(resid, force - 1)
+    assert np.all(cached == 1)
+
+
+@pytest.mark.parametrize("value", [1.0, np.float64(1.0)])
+def test_residual_scalar_model_output(value):
+    params = lmfit.Parameters()
+    params.add("contact_point", value=0)
+    delta = np.linspace(-2e-6, 2e-6, 9)
+    force = np.linspace(0, 1, 9)
+
+    def model(params, delta):
+        return value
+
+    resid = residuals.residual(params, delta, force, model, weight_cp=0)
+    assert np.allclose(resid, force - 1)
+    resid = residuals.residual(params, delta, force, model, weight_cp=1e-6,
+                               overwrite_model=True)
+    assert resid.shape == force.shape
+
+
+def test_residuals_wrapper_without_module():
+    def model_func(delta, contact_point):
+        return np.ones_like(delta)
+    # e.g. functions created dynamically or with `functools.partial`
+    model_func.__module__ = None
+
+    params = lmfit.Parameters()
+    params.add("contact_point", value=0)
+    delta = np.linspace(-2e-6, 2e-6, 9)
+    force = np.linspace(0, 1, 9)
+    wrapper = residuals.get_default_residuals_wrapper(model_func)
+    resid = wrapper(params, delta, force, weight_cp=0)
+    assert np.allclose(resid, force - 1)
@@ -1,4 +1,7 @@
 """Test model integrity"""
+import numpy as np
+import pytest
+
 from nanite import model
 
 
@@ -61,3 +64,58 @@ def test_model_parameter_units():
             else:
                 msg = "Parameter {} not registered for test!".format(key2)
                 assert False, msg
+
+
+def test_model_preserves_float32():
+    delta = np.linspace(-2e-6, 2e-6, 300)
+    for key in model.models_available:
+        md = model.models_available[key]
+        if not md.module.__name__.startswith("nanite.model."):
+            # only check the models that ship with nanite
+            continue
+        kwargs = md.get_parameter_defaults().valuesdict()
+        kwargs["contact_point"] = 1e-7
+        f64 = md.module.model_func(delta, **kwargs)
+        f32 = md.module.model_func(delta.astype(np.float32), **kwargs)
+        assert f32.dtype == np.float32, key
+        assert np.allclose(f32, f64, rtol=1e-5, atol=0), key
+
+
+@pytest.mark.parametrize("key", ["hertz_cone", "hertz_para", "hertz_pyr3s",
+                                 "sneddon_spher_approx",
+                                 "power_layer_clifford_2009"])
+def test_model_scalar_and_integer_delta(key):
+    md = model.models_available[key]
+    kwargs = md.get_parameter_defaults().valuesdict()
+    kwargs["contact_point"] = 2
+    delta = np.arange(-5, 5)
+    ref = md.module.model_func(delta.astype(float), **kwargs)
+    # integer array
+    assert np.allclose(md.module.model_func(delta, **kwargs), ref)
+    # scalar
+    for ii in range(delta.size):
+        fs = md.module.model_func(np.float64(delta[ii]), **kwargs)
+        assert np.shape(fs) == ()
+        assert np.allclose(fs, ref[ii])
+
+
+@pytest.mark.parametrize("key", ["hertz_cone", "hertz_para", "hertz_pyr3s",
+                                 "sneddon_spher_approx",
+                                 "power_layer_clifford_2009"])
+def test_model_array_parameters(key):
+    md = model.models_available[key]
+    kwargs = md.get_parameter_defaults().valuesdict()
+    kwargs["contact_point"] = 1e-7
+    delta = np.linspace(-2e-6, 2e-6, 50)
+    ref = md.module.model_func(delta, **kwargs)
+    for name in kwargs:
+        # every parameter may also be an array (e.g. one value per point)
+        kwargs_arr = dict(kwargs)
+        kwargs_arr[name] = np.full(delta.size, kwargs[name])
+        assert np.allclose(md.module.model_func(delta, **kwargs_arr), ref,
+                           rtol=1e-12, atol=0), name
+        # or broadcast beyond the shape of `delta`
+        kwargs_arr[name] = np.full((3, 1), kwargs[name])
+        fb = md.module.model_func(delta, **kwargs_arr)
+        assert fb.shape == (3, delta.size), name
+        assert np.allclose(fb, ref, rtol=1e-12, atol=0), name
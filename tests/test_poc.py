@@ -110,3 +110,18 @@ def test_poc_frechet_direct_path():
     force[50:] = np.arange(50)**2
     cp = poc.poc_frechet_direct_path(force)
     assert cp == 62  # makes sense
+    # integer force data
+    assert poc.poc_frechet_direct_path(force.astype(int)) == 62
+
+
+def test_poc_undefined_method():
+    with pytest.raises(ValueError, match="Undefined POC method 'peter'"):
+        poc.compute_poc(np.arange(100.), method="peter")
+
+
+def test_poc_estimation_list_float32():
+    force = np.zeros(100)
+    force[50:] = np.arange(50)**2
+    cp = poc.compute_poc(force, method="deviation_from_baseline")
+    assert poc.compute_poc(list(force)) == cp
+    assert poc.compute_poc(force.astype(np.float32)) == cp